@@ -42,9 +42,9 @@ def carregar_dados():
         sys.exit(1)
 
 def detectar_qubits(df):
-    """Conta quantos qubits existem baseados nas colunas do CSV."""
+    """Lista os índices dos qubits presentes nas colunas do CSV (exportação pode ser parcial)."""
     cols = [c for c in df.columns if c.startswith('q') and c.endswith('_x')]
-    return len(cols)
+    return [int(c[1:-2]) for c in cols]
 
 def player_sovereign():
     print("\n" + "▶️"*20)
@@ -54,8 +54,13 @@ def player_sovereign():
 
     # 1. Preparação dos Dados
     df = carregar_dados()
-    n_qubits = detectar_qubits(df)
+    qubits = detectar_qubits(df)
+    n_qubits = len(qubits)
     total_frames = len(df)
+    # Exportações compactas podem omitir o índice de coerência
+    tem_coerencia = all(f'q{q}_S' in df.columns for q in qubits)
+    # Frames originais da simulação (base do rastro em exportações amostradas)
+    frames_orig = df['Frame'].to_numpy() if 'Frame' in df.columns else np.arange(total_frames)
     
     # Geometria Original (Hardcoded para consistência visual)
     R_TORO = 21.0
@@ -126,33 +131,43 @@ def player_sovereign():
 
         # Métricas Médias
         # Extrai colunas de Coerência (S) e Ganho VR
-        cols_s = [row[f'q{i}_S'] for i in range(n_qubits)]
-        s_medio = np.mean(cols_s)
+        if tem_coerencia:
+            s_medio = np.mean([row[f'q{q}_S'] for q in qubits])
+            txt_coerencia = f"{s_medio:.2%}"
+        else:
+            txt_coerencia = "N/A"
+        
+        # Frame original da simulação (exportações amostradas pulam frames)
+        frame_orig = int(frames_orig[idx])
+        
+        # Rastro limitado aos últimos 25 frames da simulação (não às últimas 25 linhas)
+        lookback = int(np.searchsorted(frames_orig[:idx+1], frame_orig - 25))
+        # Interrompe o rastro no último salto entre frames retidos (evita cordas no toro)
+        saltos = np.flatnonzero(np.diff(frames_orig[lookback:idx+1]) > 1)
+        if len(saltos):
+            lookback += int(saltos[-1]) + 1
+        trail_data = df.iloc[lookback:idx+1]
         
         texto_info.set_text(
-            f"PLAYBACK: Frame {idx}/{total_frames}\n"
+            f"PLAYBACK: Frame {frame_orig} [{idx + 1}/{total_frames}]\n"
             f"STATUS: {status_txt}{q_tag}\n"
             f"---------------------------\n"
-            f"COERÊNCIA: {s_medio:.2%}\n"
+            f"COERÊNCIA: {txt_coerencia}\n"
             f"FATOR CAOS: {caos_fenix:.4f}"
         )
         texto_info.set_color(status_cor)
 
         # Atualiza Posições dos Qubits
-        for i in range(n_qubits):
-            # Define o tamanho do rastro (Trail)
-            lookback = max(0, idx - 25)
-            trail_data = df.iloc[lookback:idx+1]
-            
+        for i, q in enumerate(qubits):
             # Atualiza Rastro
-            lasers[i].set_data(trail_data[f'q{i}_x'], trail_data[f'q{i}_y'])
-            lasers[i].set_3d_properties(trail_data[f'q{i}_z'])
+            lasers[i].set_data(trail_data[f'q{q}_x'], trail_data[f'q{q}_y'])
+            lasers[i].set_3d_properties(trail_data[f'q{q}_z'])
             
             # Atualiza Cabeça (Ponto)
             # Tamanho pulsa com a coerência
-            s_local = row[f'q{i}_S']
-            pontos[i].set_data([row[f'q{i}_x']], [row[f'q{i}_y']])
-            pontos[i].set_3d_properties([row[f'q{i}_z']])
+            s_local = row[f'q{q}_S'] if tem_coerencia else 1.0
+            pontos[i].set_data([row[f'q{q}_x']], [row[f'q{q}_y']])
+            pontos[i].set_3d_properties([row[f'q{q}_z']])
             pontos[i].set_markersize(6 + 12 * s_local)
             pontos[i].set_alpha(0.7 + 0.3 * s_local)
 
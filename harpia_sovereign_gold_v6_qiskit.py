@@ -296,7 +296,8 @@ def processar_frames_sovereign_gold(n_qubits, total_frames, R_TORO, r_TORO, F_AC
         'resets_fenix': resets_fenix,
         'coerencia_media': np.mean(coerencias_medias),
         'coerencia_min': np.min(coerencias_medias),
-        'coerencia_max': np.max(coerencias_medias)
+        'coerencia_max': np.max(coerencias_medias),
+        'coerencias_frames': np.array(coerencias_medias)
     }
     
     return pd.DataFrame(telemetria), stats
@@ -408,7 +409,181 @@ def visualizar_sovereign_gold(df_sim, n_qubits, stats, R_TORO, r_TORO, F_ACHAT):
     print("✅ Visualização concluída!")
 
 # ==================================================================================
-# MÓDULO V: MAIN - ORQUESTRADOR SOVEREIGN
+# MÓDULO V: POLÍTICAS DE EXPORTAÇÃO - Amostragem e Retenção de Telemetria
+# ==================================================================================
+
+# Campos gravados por qubit (x, y, z são sempre mantidos para o Player)
+CAMPOS_QUBIT = ['x', 'y', 'z', 'S', 'VR_Ganho', 'Torque']
+
+# Políticas disponíveis:
+# - passo: exporta 1 a cada k frames
+# - campos / qubits: subconjunto exportado (None = todos)
+# - janela: frames mantidos em resolução total antes/depois de cada evento
+# - gatilho_fenix: ativação do Protocolo Fênix é um evento
+# - limiar_ruido: |Ruido_Vibracional| acima do limiar é um evento
+# - limiar_coerencia: coerência média do frame abaixo do limiar é um evento
+# - bloco_resumo: frames agregados por linha no arquivo de resumo
+POLITICAS_EXPORTACAO = {
+    'completa': {
+        'passo': 1,
+        'campos': None,
+        'qubits': None,
+        'janela': 0,
+        'gatilho_fenix': False,
+        'limiar_ruido': None,
+        'limiar_coerencia': None,
+        'bloco_resumo': 50,
+        'casas_decimais': 8,
+    },
+    'compacta': {
+        'passo': 25,
+        'campos': ['x', 'y', 'z', 'S'],
+        'qubits': None,
+        'janela': 10,
+        'gatilho_fenix': True,
+        'limiar_ruido': 0.2,
+        'limiar_coerencia': 0.95,
+        'bloco_resumo': 50,
+        'casas_decimais': 6,
+    },
+}
+
+def selecionar_frames_exportacao(df_sim, s_frames, politica):
+    """
+    Monta a máscara de frames retidos em resolução total.
+    
+    Um frame é retido se cair no passo de amostragem ou dentro da janela
+    de algum evento (ativação Fênix, surto de ruído, queda de coerência).
+    
+    Returns:
+        retidos: array booleano com um valor por frame
+    """
+    n = len(df_sim)
+    passo = max(1, int(politica.get('passo', 1)))
+    retidos = (np.arange(n) % passo) == 0
+    
+    eventos = np.zeros(n, dtype=bool)
+    
+    if politica.get('gatilho_fenix'):
+        # Apenas a borda de subida: o Fênix permanece ativo por longos trechos
+        fenix = (df_sim['Caos_Fenix'] < df_sim['Caos_Original']).to_numpy()
+        eventos |= fenix & ~np.concatenate(([False], fenix[:-1]))
+    
+    if politica.get('limiar_ruido') is not None:
+        eventos |= (df_sim['Ruido_Vibracional'].abs() > politica['limiar_ruido']).to_numpy()
+    
+    if politica.get('limiar_coerencia') is not None:
+        eventos |= s_frames < politica['limiar_coerencia']
+    
+    idx_eventos = np.flatnonzero(eventos)
+    if len(idx_eventos):
+        # Dilata cada evento em ±janela frames (soma acumulada de bordas)
+        janela = max(0, int(politica.get('janela', 0)))
+        bordas = np.zeros(n + 1, dtype=int)
+        np.add.at(bordas, np.clip(idx_eventos - janela, 0, n), 1)
+        np.add.at(bordas, np.clip(idx_eventos + janela + 1, 0, n), -1)
+        retidos |= np.cumsum(bordas[:-1]) > 0
+    
+    return retidos
+
+def resumir_intervalos(df_sim, s_frames, retidos, bloco_resumo):
+    """
+    Agrega os frames descartados em blocos de estatísticas.
+    
+    Cada trecho contíguo entre frames retidos é dividido em blocos de
+    até `bloco_resumo` frames, e cada bloco vira uma linha de resumo.
+    """
+    descartados = np.flatnonzero(~retidos)
+    if len(descartados) == 0:
+        return pd.DataFrame()
+    
+    bloco_resumo = max(1, int(bloco_resumo))
+    cortes = np.flatnonzero(np.diff(descartados) != 1) + 1
+    resumos = []
+    
+    for trecho in np.split(descartados, cortes):
+        for inicio in range(0, len(trecho), bloco_resumo):
+            idx = trecho[inicio:inicio + bloco_resumo]
+            parte = df_sim.iloc[idx]
+            s_parte = s_frames[idx]
+            resumos.append({
+                'Frame_Inicio': int(parte['Frame'].iloc[0]),
+                'Frame_Fim': int(parte['Frame'].iloc[-1]),
+                'N_Frames': len(idx),
+                'Caos_Fenix_Medio': parte['Caos_Fenix'].mean(),
+                'Fenix_Ativo': int((parte['Caos_Fenix'] < parte['Caos_Original']).sum()),
+                'Ruido_Max_Abs': parte['Ruido_Vibracional'].abs().max(),
+                'Fluxo_Qiskit_Medio': parte['Fluxo_Qiskit'].mean(),
+                'Coerencia_Media': s_parte.mean(),
+                'Coerencia_Min': s_parte.min(),
+            })
+    
+    return pd.DataFrame(resumos)
+
+def filtrar_colunas_exportacao(df_sim, n_qubits, politica):
+    """
+    Seleciona colunas globais + campos/qubits escolhidos pela política.
+    As posições (x, y, z) são sempre mantidas para o Player.
+    """
+    qubits = politica.get('qubits')
+    if qubits is None:
+        qubits = range(n_qubits)
+    else:
+        invalidos = [i for i in qubits if not 0 <= i < n_qubits]
+        if invalidos:
+            print(f"⚠️  Aviso: Qubits inexistentes ignorados na exportação: {invalidos}")
+        qubits = [i for i in qubits if 0 <= i < n_qubits] or range(n_qubits)
+    
+    desconhecidos = [c for c in politica.get('campos') or [] if c not in CAMPOS_QUBIT]
+    if desconhecidos:
+        print(f"⚠️  Aviso: Campos desconhecidos ignorados na exportação: {desconhecidos}")
+    
+    escolhidos = set(politica.get('campos') or CAMPOS_QUBIT) | {'x', 'y', 'z'}
+    campos = [c for c in CAMPOS_QUBIT if c in escolhidos]
+    
+    colunas_globais = [c for c in df_sim.columns if not c.startswith('q')]
+    colunas_qubits = [f'q{i}_{c}' for i in qubits for c in campos]
+    return colunas_globais + colunas_qubits
+
+def exportar_telemetria(df_sim, n_qubits, s_frames, output_file, politica):
+    """
+    Exporta a telemetria aplicando a política de amostragem e retenção.
+    
+    Frames retidos vão para `output_file` (compatível com o Player);
+    os trechos descartados são agregados em `<output_file>_resumo.csv`.
+    
+    Args:
+        s_frames: coerência média por frame (stats['coerencias_frames'])
+    
+    Returns:
+        dict com contagens de frames e arquivo de resumo (ou None)
+    """
+    retidos = selecionar_frames_exportacao(df_sim, s_frames, politica)
+    colunas = filtrar_colunas_exportacao(df_sim, n_qubits, politica)
+    float_format = f"%.{politica.get('casas_decimais', 8)}f"
+    
+    df_sim.loc[retidos, colunas].to_csv(output_file, index=False, float_format=float_format)
+    
+    df_resumo = resumir_intervalos(df_sim, s_frames, retidos, politica.get('bloco_resumo', 50))
+    arquivo_resumo = os.path.splitext(output_file)[0] + "_resumo.csv"
+    if not df_resumo.empty:
+        df_resumo.to_csv(arquivo_resumo, index=False, float_format=float_format)
+    else:
+        # Remove resumo de uma execução anterior que não descreve estes dados
+        if os.path.exists(arquivo_resumo):
+            os.remove(arquivo_resumo)
+            print(f"🗑️  Resumo antigo removido: {arquivo_resumo}")
+        arquivo_resumo = None
+    
+    return {
+        'frames_exportados': int(retidos.sum()),
+        'frames_total': len(df_sim),
+        'blocos_resumo': len(df_resumo),
+        'arquivo_resumo': arquivo_resumo
+    }
+
+# ==================================================================================
+# MÓDULO VI: MAIN - ORQUESTRADOR SOVEREIGN
 # ==================================================================================
 
 def harpia_sovereign_gold_v3():
@@ -425,9 +600,32 @@ def harpia_sovereign_gold_v3():
         n_qubits = int(input("🔢 Qubits (Gold Standard: 120): ") or 120)
         total_frames = int(input("🎞️  Frames (Gold Standard: 1000): ") or 1000)
         habilitar_vr = input("🛡️  Habilitar VR Shielding? (s/n): ").lower() != 'n'
+        nome_politica = input("📦 Política de exportação (completa/compacta): ").strip().lower() or 'completa'
+        passo_txt = input("🎚️  Exportar 1 a cada k frames (Enter = padrão da política): ").strip()
+        campos_txt = input(f"🧩 Campos por qubit {CAMPOS_QUBIT} (ex: x,y,z,S; Enter = padrão): ").strip()
+        qubits_txt = input("🎯 Qubits exportados (ex: 0,1,5; Enter = padrão): ").strip()
     except (ValueError, EOFError):
         n_qubits, total_frames = 120, 1000
         habilitar_vr = True
+        nome_politica = 'completa'
+        passo_txt = campos_txt = qubits_txt = ''
+    
+    if nome_politica not in POLITICAS_EXPORTACAO:
+        print(f"⚠️  Política '{nome_politica}' desconhecida. Usando 'completa'.")
+        nome_politica = 'completa'
+    
+    # Ajustes da política escolhida (limiares de eventos: editar POLITICAS_EXPORTACAO)
+    politica = dict(POLITICAS_EXPORTACAO[nome_politica])
+    try:
+        if passo_txt:
+            politica['passo'] = max(1, int(passo_txt))
+        if campos_txt:
+            politica['campos'] = [c.strip() for c in campos_txt.split(',') if c.strip()]
+        if qubits_txt:
+            politica['qubits'] = [int(q) for q in qubits_txt.split(',') if q.strip()]
+    except ValueError:
+        print("⚠️  Ajuste de exportação inválido. Usando padrões da política.")
+        politica = dict(POLITICAS_EXPORTACAO[nome_politica])
     
     # GEOMETRIA SUB-ATÔMICA (Precisão Cirúrgica)
     R_TORO = 21.0
@@ -441,15 +639,18 @@ def harpia_sovereign_gold_v3():
     print(f"   - Membrana Geodésica: {F_ACHAT:.8f}")
     print(f"   - Motor VR: {'DISPONÍVEL' if VR_AVAILABLE else 'SIMULADO'}")
     print(f"   - IBM Qiskit: {'CONECTADO' if QISKIT_AVAILABLE else 'MODO EMULAÇÃO'}")
+    print(f"   - Exportação: {nome_politica.upper()} (passo {politica['passo']})")
     
     # Processar frames
     df_sim, stats = processar_frames_sovereign_gold(
         n_qubits, total_frames, R_TORO, r_TORO, F_ACHAT, habilitar_vr
     )
     
-    # Exportação com 8 casas decimais
+    # Exportação conforme a política escolhida
     output_file = "telemetria_sovereign_gold_v3.csv"
-    df_sim.to_csv(output_file, index=False, float_format='%.8f')
+    export_info = exportar_telemetria(
+        df_sim, n_qubits, stats['coerencias_frames'], output_file, politica
+    )
     
     # Relatório Final
     print("\n" + "🏆"*35)
@@ -461,6 +662,9 @@ def harpia_sovereign_gold_v3():
     print(f"⚡ Filtro Kalman: ATIVO")
     print(f"⚛️  Qiskit Integration: {'Simulação Quântica Real' if QISKIT_AVAILABLE else 'N/A'}")
     print(f"💾 Telemetria salva: {output_file}")
+    print(f"📦 Frames exportados: {export_info['frames_exportados']}/{export_info['frames_total']}")
+    if export_info['arquivo_resumo']:
+        print(f"📑 Resumo ({export_info['blocos_resumo']} blocos): {export_info['arquivo_resumo']}")
     print("🏆"*35)
     
     # Visualização